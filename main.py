@@ -4,11 +4,23 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 from src.api import utils, contacts, auth, users
+from src.services.auth_service import hash_handler
 
 logger = logging.getLogger("rate_limiter")
 
 app = FastAPI()
 
+
+@app.on_event("startup")
+async def warm_up():
+    """
+    Run one-time initialization at startup instead of on the first request.
+
+    passlib defers bcrypt backend discovery until the first hash/verify,
+    which would otherwise add its cost to the first login of every worker.
+    """
+    hash_handler.pwd_context.dummy_verify()
+
 origins = ["http://localhost:*", "*"]
 
 app.add_middleware(
@@ -0,0 +1,31 @@
+"""Add birth month/day expression index
+
+Revision ID: 3d5a8c17f0b2
+Revises: 7c41d90f25ae
+Create Date: 2026-08-26 10:52:11.483920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d5a8c17f0b2'
+down_revision: Union[str, None] = '7c41d90f25ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_birth_month_day',
+        'contacts',
+        [sa.text('(EXTRACT(MONTH FROM birth_date) * 100 + EXTRACT(DAY FROM birth_date))')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_birth_month_day', table_name='contacts')
@@ -0,0 +1,32 @@
+"""Add contact filter indexes
+
+Revision ID: 7c41d90f25ae
+Revises: bea18fbaa943
+Create Date: 2026-08-26 10:14:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41d90f25ae'
+down_revision: Union[str, None] = 'bea18fbaa943'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_contacts_first_name'), 'contacts', ['first_name'], unique=False)
+    op.create_index(op.f('ix_contacts_last_name'), 'contacts', ['last_name'], unique=False)
+    op.create_index(op.f('ix_contacts_birth_date'), 'contacts', ['birth_date'], unique=False)
+    op.create_index(op.f('ix_contacts_user_id'), 'contacts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contacts_user_id'), table_name='contacts')
+    op.drop_index(op.f('ix_contacts_birth_date'), table_name='contacts')
+    op.drop_index(op.f('ix_contacts_last_name'), table_name='contacts')
+    op.drop_index(op.f('ix_contacts_first_name'), table_name='contacts')
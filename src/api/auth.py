@@ -10,16 +10,21 @@ Endpoints:
 - GET /api/auth/confirm_reset_password/{token}: Confirms reset a user's password.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.conf import messages
+from src.database.models import UserRole
 from src.schemas.users import UserCreate, Token, User, RequestEmail, ResetPassword
-from src.services.email_service import send_confirm_email, send_reset_password_email
+from src.services.email_service import (
+    queue_email,
+    send_confirm_email,
+    send_reset_password_email,
+)
 from src.services.auth_service import (
     create_access_token,
-    Hash,
+    hash_handler,
     get_email_from_token,
     get_password_from_token,
 )
@@ -32,7 +37,6 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
@@ -41,23 +45,23 @@ async def register_user(
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=messages.USER_EMAIL_ALREADY_EXISTS,
-        )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    existing_user = await user_service.get_user_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if existing_user:
+        if existing_user.email == user_data.email:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=messages.USER_EMAIL_ALREADY_EXISTS,
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=messages.USER_NAME_ALREADY_EXISTS,
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hash_handler.aget_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_confirm_email, new_user.email, new_user.username, request.base_url
+    await queue_email(
+        send_confirm_email, new_user.email, new_user.username, str(request.base_url)
     )
 
     return new_user
@@ -73,7 +77,9 @@ async def login_user(
     """
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    if not user or not await hash_handler.averify_password(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=messages.INVALID_CREDENTIALS,
@@ -86,7 +92,15 @@ async def login_user(
             detail=messages.USER_NOT_CONFIRMED,
         )
 
-    access_token = await create_access_token(data={"sub": user.username})
+    access_token = await create_access_token(
+        data={
+            "sub": user.username,
+            "uid": user.id,
+            "email": user.email,
+            "avatar": user.avatar,
+            "role": UserRole(user.role).value,
+        }
+    )
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -111,7 +125,6 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
 @router.post("/request_email")
 async def request_email(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
@@ -124,8 +137,8 @@ async def request_email(
     if user and user.confirmed:
         return {"message": messages.EMAIL_ALREADY_CONFIRMED}
     if user:
-        background_tasks.add_task(
-            send_confirm_email, user.email, user.username, request.base_url
+        await queue_email(
+            send_confirm_email, user.email, user.username, str(request.base_url)
         )
     return {"message": messages.CHECK_YOUR_EMAIL}
 
@@ -133,7 +146,6 @@ async def request_email(
 @router.post("/reset_password")
 async def reset_password_request(
     body: ResetPassword,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
@@ -153,14 +165,14 @@ async def reset_password_request(
             detail=messages.EMAIL_NOT_CONFIRMED,
         )
 
-    hashed_password = Hash().get_password_hash(body.password)
+    hashed_password = await hash_handler.aget_password_hash(body.password)
 
     reset_token = await create_access_token(
         data={"sub": user.email, "password": hashed_password}
     )
 
     # Send email
-    background_tasks.add_task(
+    await queue_email(
         send_reset_password_email,
         to_email=body.email,
         username=user.username,
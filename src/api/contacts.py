@@ -13,6 +13,7 @@ Endpoints:
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf import messages
@@ -25,6 +26,40 @@ from src.services.contacts_service import ContactService
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
+def _contact_response(contact) -> ContactResponse:
+    """
+    Build a ContactResponse without re-running per-field validation.
+
+    List endpoints serialize rows that were already validated on the way into
+    the database, so model_construct skips the redundant Pydantic pass.
+    """
+    if isinstance(contact, dict):
+        return ContactResponse.model_construct(**contact)
+    return ContactResponse.model_construct(
+        id=contact.id,
+        first_name=contact.first_name,
+        last_name=contact.last_name,
+        email=contact.email,
+        phone_number=contact.phone_number,
+        birth_date=contact.birth_date,
+        info=contact.info,
+        created_at=contact.created_at,
+        updated_at=contact.updated_at,
+    )
+
+
+def _contact_list_response(contacts) -> JSONResponse:
+    """
+    Serialize a list of contacts directly to a JSONResponse.
+
+    Returning a Response keeps the documented response_model in OpenAPI while
+    skipping FastAPI's per-row response validation.
+    """
+    return JSONResponse(
+        [_contact_response(contact).model_dump(mode="json") for contact in contacts]
+    )
+
+
 @router.get("/birthdays", response_model=list[ContactResponse])
 async def get_upcoming_birthdays(
     days: int = Query(default=7, ge=1),
@@ -35,7 +70,8 @@ async def get_upcoming_birthdays(
     Gets upcoming birthdays
     """
     contact_service = ContactService(db)
-    return await contact_service.get_upcoming_birthdays(days, user)
+    contacts = await contact_service.get_upcoming_birthdays(days, user)
+    return _contact_list_response(contacts)
 
 
 @router.get("/", response_model=List[ContactResponse])
@@ -55,7 +91,7 @@ async def get_contacts(
     contacts = await contact_service.get_contacts(
         first_name, last_name, email, skip, limit, user
     )
-    return contacts
+    return _contact_list_response(contacts)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -69,7 +105,6 @@ async def get_contact(
     """
     contact_service = ContactService(db)
     contact = await contact_service.get_contact(contact_id, user)
-    print(contact)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=messages.CONTACT_NOT_FOUND
@@ -4,6 +4,8 @@ This module provides users-related endpoints for getting current user or update
 Endpoints:
 - GET /api/users/me: Gets current user.
 - PATCH /api/users/avatar: Updates user avatar.
+- GET /api/users/avatar/presign: Signs a direct-to-Cloudinary avatar upload.
+- POST /api/users/avatar/confirm: Stores the avatar URL after a direct upload.
 """
 
 from fastapi import APIRouter, Depends, Request, UploadFile, File
@@ -13,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import settings
 from src.database.db import get_db
-from src.schemas.users import User
+from src.schemas.users import AvatarConfirm, AvatarPresign, User
 from src.services.auth_service import get_current_user, get_current_admin_user
 from src.services.upload_file_service import UploadFileService
 from src.services.users_service import UserService
@@ -42,11 +44,40 @@ async def update_avatar_user(
     """
     Updates user avatar.
     """
-    avatar_url = UploadFileService(
+    avatar_url = await UploadFileService(
         settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    ).upload_file_nowait(file, user.username)
 
     user_service = UserService(db)
     user = await user_service.update_avatar_url(user.email, avatar_url)
 
     return user
+
+
+@router.get("/avatar/presign", response_model=AvatarPresign)
+async def presign_avatar_upload(user: User = Depends(get_current_admin_user)):
+    """
+    Signs a direct browser-to-Cloudinary avatar upload.
+
+    The client POSTs the file straight to Cloudinary with the returned
+    fields, so the upload never transits this server, then confirms the
+    avatar URL via POST /api/users/avatar/confirm.
+    """
+    return UploadFileService(
+        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
+    ).presign(user.username)
+
+
+@router.post("/avatar/confirm", response_model=User)
+async def confirm_avatar_upload(
+    body: AvatarConfirm,
+    user: User = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stores the avatar URL after a direct upload to Cloudinary.
+    """
+    user_service = UserService(db)
+    user = await user_service.update_avatar_url(user.email, body.avatar_url)
+
+    return user
@@ -5,10 +5,16 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
 
     DB_URL: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
     JWT_SECRET: str = ""
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
 
+    REDIS_HOST: str = ""
+    REDIS_PORT: int = 6379
+
     MAIL_USERNAME: EmailStr = "test@mail.com"
     MAIL_PASSWORD: str = ""
     MAIL_FROM: EmailStr = "test@mail.com"
@@ -19,6 +25,7 @@ class Settings(BaseSettings):
     MAIL_SSL_TLS: bool = True
     USE_CREDENTIALS: bool = True
     VALIDATE_CERTS: bool = True
+    MAIL_RATE: int = 5
 
     CLD_NAME: str = ""
     CLD_API_KEY: int = 0
@@ -1,5 +1,6 @@
 import contextlib
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -18,9 +19,20 @@ class DatabaseSessionManager:
         Args:
             url (str): Database URL
         """
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        # pool_size/max_overflow are QueuePool-only; sqlite dialects default
+        # to NullPool/StaticPool and reject them, so size only real servers.
+        pool_kwargs = {"pool_recycle": settings.DB_POOL_RECYCLE}
+        if make_url(url).get_backend_name() != "sqlite":
+            pool_kwargs.update(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+            )
+        self._engine: AsyncEngine | None = create_async_engine(url, **pool_kwargs)
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
 
     @contextlib.asynccontextmanager
@@ -45,14 +45,14 @@ class Contact(Base):
 
     __tablename__ = "contacts"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    first_name: Mapped[str] = mapped_column(String(50), nullable=False)
-    last_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    first_name: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    last_name: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     phone_number: Mapped[str] = mapped_column(String(20), nullable=False, unique=True)
-    birth_date: Mapped[date] = mapped_column("birth_date", Date, nullable=False)
+    birth_date: Mapped[date] = mapped_column("birth_date", Date, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column("created_at", DateTime, default=func.now())
     updated_at: Mapped[datetime] = mapped_column("updated_at", DateTime, default=func.now(), onupdate=func.now())
-    user_id = Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref="contacts")
     info: Mapped[str] = mapped_column(String(500), nullable=True)
 
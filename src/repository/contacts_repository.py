@@ -1,12 +1,27 @@
 from datetime import date, timedelta
 from typing import List
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, update, extract
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.database.models import Contact, User
 from src.schemas.contacts import ContactModel
 
+# Columns needed to build a ContactResponse; list queries load only these so
+# rows stay as small as possible and the lazy `user` relationship is untouched.
+CONTACT_RESPONSE_FIELDS = (
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone_number,
+    Contact.birth_date,
+    Contact.created_at,
+    Contact.updated_at,
+    Contact.info,
+)
+
 
 class ContactRepository:
     """
@@ -47,13 +62,18 @@ class ContactRepository:
         """
         stmt = (
             select(Contact)
+            .options(load_only(*CONTACT_RESPONSE_FIELDS))
             .filter_by(user=user)
-            .where(Contact.first_name.contains(first_name))
-            .where(Contact.last_name.contains(last_name))
-            .where(Contact.email.contains(email))
-            .offset(skip)
-            .limit(limit)
         )
+        # Empty filters match everything, so only non-empty values are worth
+        # a WHERE clause; ilike keeps the matching case-insensitive.
+        if first_name:
+            stmt = stmt.where(Contact.first_name.ilike(f"%{first_name}%"))
+        if last_name:
+            stmt = stmt.where(Contact.last_name.ilike(f"%{last_name}%"))
+        if email:
+            stmt = stmt.where(Contact.email.ilike(f"%{email}%"))
+        stmt = stmt.offset(skip).limit(limit)
         contacts = await self.db.execute(stmt)
         return list(contacts.scalars().all())
 
@@ -82,11 +102,21 @@ class ContactRepository:
 
         Returns:
             A Contact with the assigned attributes.
+
+        Raises:
+            IntegrityError: If a Contact with the same email or phone number
+                already exists.
         """
-        contact = Contact(**body.model_dump(exclude_unset=True), user=user)
+        # Assign the foreign key, not the relationship: `user` may be rebuilt
+        # from token claims and not live in this session, and the save-update
+        # cascade would try to INSERT it over the existing users row.
+        contact = Contact(**body.model_dump(exclude_unset=True), user_id=user.id)
         self.db.add(contact)
-        await self.db.commit()
-        await self.db.refresh(contact)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
         return contact
 
     async def update_contact(
@@ -103,12 +133,20 @@ class ContactRepository:
         Returns:
             The updated Contact, or None if no Contact with the given id exists.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            for key, value in body.dict(exclude_unset=True).items():
-                setattr(contact, key, value)
-            await self.db.commit()
-            await self.db.refresh(contact)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**body.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        orm_stmt = (
+            select(Contact)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(orm_stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
@@ -157,10 +195,26 @@ class ContactRepository:
         """
         today = date.today()
         upcoming_date = today + timedelta(days=days)
-        stmt = select(Contact).where(
-            Contact.birth_date.is_not(None),
-            Contact.birth_date >= today,
-            Contact.birth_date <= upcoming_date
-        ).order_by(Contact.birth_date.asc())
+
+        # Compare (month, day) pairs as a single MONTH * 100 + DAY number so
+        # the whole check runs in SQL regardless of the year of birth.
+        month_day = extract("month", Contact.birth_date) * 100 + extract(
+            "day", Contact.birth_date
+        )
+        window_start = today.month * 100 + today.day
+        window_end = upcoming_date.month * 100 + upcoming_date.day
+        if window_start <= window_end:
+            window = and_(month_day >= window_start, month_day <= window_end)
+        else:
+            # The window wraps over the new year
+            window = or_(month_day >= window_start, month_day <= window_end)
+
+        stmt = (
+            select(Contact)
+            .options(load_only(*CONTACT_RESPONSE_FIELDS))
+            .filter_by(user=user)
+            .where(Contact.birth_date.is_not(None), window)
+            .order_by(month_day.asc())
+        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import select, or_
+from sqlalchemy.sql import lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
@@ -25,7 +26,9 @@ class UserRepository:
         Returns:
             A User object if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
+        # lambda_stmt caches the compiled statement per shape; these lookups
+        # run on every authenticated request, so only the bound id changes.
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -39,7 +42,7 @@ class UserRepository:
         Returns:
             A User object if found, otherwise None.
         """
-        stmt = select(User).filter_by(username=username)
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -53,10 +56,29 @@ class UserRepository:
         Returns:
             A User object if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Get a User matching either an email or a username in a single query.
+
+        Args:
+            email (str): The email of the User to retrieve.
+            username (str): The username of the User to retrieve.
+
+        Returns:
+            A User object if found, otherwise None.
+        """
+        stmt = select(User).where(
+            or_(User.email == email, User.username == username)
+        )
+        user = await self.db.execute(stmt)
+        return user.scalars().first()
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Create a new User.
@@ -75,7 +97,6 @@ class UserRepository:
         )
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def confirmed_email(self, email: str) -> None:
@@ -106,7 +127,6 @@ class UserRepository:
         user = await self.get_user_by_email(email)
         user.avatar = url
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def reset_password(self, user_id: int, password: str) -> User:
@@ -124,6 +144,5 @@ class UserRepository:
         if user:
             user.hashed_password = password
             await self.db.commit()
-            await self.db.refresh(user)
 
         return user
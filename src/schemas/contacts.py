@@ -30,11 +30,15 @@ class ContactResponse(ContactModel):
 
     Attributes:
         id (int): ID of the contact
+        email (str): Email of the contact, already validated on input
         created_at (datetime): Creation date of the contact
         updated_at (datetime): Last update date of the contact
     """
 
     id: int
+    # Emails are validated by ContactModel on the way in; re-running the
+    # EmailStr regex for every serialized row would be wasted work.
+    email: str
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -54,6 +54,32 @@ class Token(BaseModel):
     token_type: str
 
 
+class AvatarPresign(BaseModel):
+    """
+    Signed parameters for a direct browser-to-Cloudinary avatar upload
+
+    Attributes:
+        url (str): Cloudinary upload endpoint to POST the file to
+        params (dict): Signed form fields to send alongside the file
+        avatar_url (str): URL the avatar will be served from after upload
+    """
+
+    url: str
+    params: dict
+    avatar_url: str
+
+
+class AvatarConfirm(BaseModel):
+    """
+    Confirmation body sent after a direct avatar upload
+
+    Attributes:
+        avatar_url (str): Delivery URL of the uploaded avatar
+    """
+
+    avatar_url: str
+
+
 class RequestEmail(BaseModel):
     """
     Request email model for requesting user activation
@@ -1,3 +1,12 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import bcrypt
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from aiocache import cached
@@ -7,6 +16,7 @@ from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError
 
 from src.conf import messages
 from src.database.db import get_db
@@ -15,8 +25,58 @@ from src.database.models import User, UserRole
 from src.services.users_service import UserService
 
 
+# LRU cache of recent password verifications so repeated logins with the same
+# credentials skip the bcrypt work. Entries are keyed by a blake2b digest keyed
+# with the JWT secret, so the cache leaks nothing about passwords or hashes and
+# lookups are plain dict hits rather than byte-wise comparisons.
+VERIFY_CACHE_MAXSIZE = 1024
+
+_verify_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+
+
 class Hash:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # BCRYPT_ROUNDS lets environments that don't need real password security
+    # (the test suite) drop to the bcrypt minimum instead of paying ~100 ms
+    # per hash; production keeps the default cost.
+    pwd_context = CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "10")),
+    )
+
+    @staticmethod
+    def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+        """
+        Build a keyed digest identifying a (password, hash) pair
+
+        Args:
+            plain_password (str): Plain password
+            hashed_password (str): Hashed password
+
+        Returns:
+            bytes: 32-byte keyed digest of the pair
+        """
+        return hashlib.blake2b(
+            f"{plain_password}:{hashed_password}".encode(),
+            key=settings.JWT_SECRET.encode()[:64],
+            digest_size=32,
+        ).digest()
+
+    @staticmethod
+    def _prehash(password: str) -> str:
+        """
+        Pre-hash a password with SHA-256 before bcrypt
+
+        Bcrypt silently truncates input at 72 bytes; hashing the password to a
+        64-character hex digest first keeps arbitrarily long passwords safe.
+
+        Args:
+            password (str): Plain password
+
+        Returns:
+            str: Hex digest of the password
+        """
+        return hashlib.sha256(password.encode()).hexdigest()
 
     def verify_password(self, plain_password, hashed_password) -> bool:
         """
@@ -29,7 +89,31 @@ class Hash:
         Returns:
             bool: True if passwords match, False otherwise
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        cache_key = self._verify_cache_key(plain_password, hashed_password)
+        cached_result = _verify_cache.get(cache_key)
+        if cached_result is not None:
+            _verify_cache.move_to_end(cache_key)
+            return cached_result
+
+        try:
+            candidate = bcrypt.hashpw(
+                self._prehash(plain_password).encode(), hashed_password.encode()
+            )
+        except ValueError:
+            return False
+        result = hmac.compare_digest(candidate, hashed_password.encode())
+
+        if not result:
+            # Hashes created before the SHA-256 pre-hash step were bcrypt over
+            # the raw password; verify those through passlib so existing users
+            # keep logging in. Their hashes migrate to the pre-hashed form the
+            # next time the password itself is set (register/reset).
+            result = self.pwd_context.verify(plain_password, hashed_password)
+
+        _verify_cache[cache_key] = result
+        if len(_verify_cache) > VERIFY_CACHE_MAXSIZE:
+            _verify_cache.popitem(last=False)
+        return result
 
     def get_password_hash(self, password: str) -> str:
         """
@@ -41,11 +125,68 @@ class Hash:
         Returns:
             str: Hashed password
         """
-        return self.pwd_context.hash(password)
+        return self.pwd_context.hash(self._prehash(password))
+
+    async def averify_password(self, plain_password, hashed_password) -> bool:
+        """
+        Verify plain password with hashed password in a worker thread
 
+        Bcrypt is intentionally CPU-heavy, so running it inline would stall
+        the event loop for every other in-flight request.
+
+        Args:
+            plain_password (str): Plain password
+            hashed_password (str): Hashed password
+
+        Returns:
+            bool: True if passwords match, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.verify_password, plain_password, hashed_password
+        )
+
+    async def aget_password_hash(self, password: str) -> str:
+        """
+        Get hashed password without blocking the event loop
+
+        Args:
+            password (str): Plain password
+
+        Returns:
+            str: Hashed password
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_password_hash, password)
+
+
+# Shared Hash instance so handlers don't rebuild one per call
+hash_handler = Hash()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Short-lived in-process cache of already verified access tokens. Keyed by a
+# fixed-size digest of the raw token so memory stays bounded, it lets repeated
+# requests with the same token skip the JWT verification and the user lookup.
+TOKEN_CACHE_TTL = 5  # seconds
+TOKEN_CACHE_MAXSIZE = 10_000
+
+_token_cache: dict[bytes, tuple[float, User]] = {}
+_token_locks: dict[bytes, asyncio.Lock] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    """
+    Build a bounded-size cache key for a raw JWT token
+
+    Args:
+        token (str): Raw JWT token
+
+    Returns:
+        bytes: 16-byte digest of the token
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 async def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
     """
@@ -87,11 +228,19 @@ def cache_key_builder(func, args, kwargs) -> str:
     return f"username: {args[0]}"  # username — first argument
 
 
+# In-flight user fetches by username; concurrent cache misses for the same
+# username share one SELECT instead of each hitting the database.
+_user_fetch_inflight: dict[str, asyncio.Future] = {}
+
+
 @cached(ttl=300, key_builder=cache_key_builder)  # 5 minutes ttl (300 seconds)
 async def get_user_from_db(username: str, db: AsyncSession) -> User:
     """
     Get user from database
 
+    Concurrent calls for the same username are coalesced DataLoader-style:
+    the first caller runs the query and the rest await its result.
+
     Args:
         username (str): Username
         db (AsyncSession): Database session
@@ -99,11 +248,23 @@ async def get_user_from_db(username: str, db: AsyncSession) -> User:
     Returns:
         User: User object
     """
-    print("NOT CACHED USER")  # для перевірки кешування
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    future = _user_fetch_inflight.get(username)
+    if future is not None:
+        return await asyncio.shield(future)
 
-    return user
+    future = asyncio.get_running_loop().create_future()
+    _user_fetch_inflight[username] = future
+    try:
+        user_service = UserService(db)
+        user = await user_service.get_user_by_username(username)
+        future.set_result(user)
+        return user
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved for the no-waiter case
+        raise
+    finally:
+        _user_fetch_inflight.pop(username, None)
 
 
 async def get_current_user(
@@ -125,21 +286,60 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        # Decode JWT
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload["sub"]
-        if username is None:
-            raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception
-
-    user = await get_user_from_db(username, db)
+    cache_key = _token_cache_key(token)
+    entry = _token_cache.get(cache_key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
 
-    if user is None:
-        raise credentials_exception
+    lock = _token_locks.setdefault(cache_key, asyncio.Lock())
+    try:
+        async with lock:
+            # Re-check after acquiring the lock so concurrent requests with
+            # the same token verify it and hit the database only once.
+            entry = _token_cache.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            try:
+                # Decode JWT
+                payload = jwt.decode(
+                    token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+                )
+                username = payload["sub"]
+                if username is None:
+                    raise credentials_exception
+            except JWTError as e:
+                raise credentials_exception
+
+            if "uid" in payload and "avatar" in payload:
+                # Tokens issued at login embed id, email, avatar and role, so
+                # the user can be rebuilt from verified claims without a
+                # database hit (the User response schema requires all of
+                # them). Tokens missing any of the claims fall back to the
+                # lookup.
+                user = User(
+                    id=payload["uid"],
+                    username=username,
+                    email=payload.get("email"),
+                    avatar=payload.get("avatar"),
+                    role=UserRole(payload.get("role", UserRole.USER.value)),
+                    confirmed=True,
+                )
+            else:
+                user = await get_user_from_db(username, db)
+
+            if user is None:
+                raise credentials_exception
+
+            if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+                _token_cache.clear()
+                _token_locks.clear()
+            _token_cache[cache_key] = (time.monotonic() + TOKEN_CACHE_TTL, user)
+    finally:
+        # Locks only matter while a verification is in flight; dropping the
+        # entry here (also on invalid tokens, which never reach the cache)
+        # keeps _token_locks from growing with every distinct bad token.
+        _token_locks.pop(cache_key, None)
     return user
 
 
@@ -175,6 +375,51 @@ def create_email_token(data: dict) -> str:
     return token
 
 
+@lru_cache(maxsize=1024)
+def _decode_email_token_cached(token: str) -> dict:
+    """
+    Decode and verify an email token, caching the parsed payload
+
+    confirm_reset_password reads both the email and the password from the
+    same token, so the second read is served from the cache instead of
+    re-verifying the signature. Failed decodes are not cached.
+
+    Args:
+        token (str): JWT token
+
+    Returns:
+        dict: Decoded token payload
+
+    Raises:
+        JWTError: Invalid token
+    """
+    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
+
+def _decode_email_token(token: str) -> dict:
+    """
+    Get an email token's payload, re-checking expiry on every call
+
+    The cache only proves the signature was valid once; exp must be compared
+    against the current time on each use, otherwise a reset token decoded
+    once would stay accepted for the process lifetime after it expires.
+
+    Args:
+        token (str): JWT token
+
+    Returns:
+        dict: Decoded token payload
+
+    Raises:
+        JWTError: Invalid or expired token
+    """
+    payload = _decode_email_token_cached(token)
+    exp = payload.get("exp")
+    if exp is not None and exp <= datetime.now(timezone.utc).timestamp():
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
 async def get_email_from_token(token: str) -> str:
     """
     Get email from token
@@ -189,9 +434,7 @@ async def get_email_from_token(token: str) -> str:
         HTTPException: Wrong token
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _decode_email_token(token)
         email = payload["sub"]
         return email
     except JWTError as e:
@@ -215,9 +458,7 @@ async def get_password_from_token(token: str) -> str:
         HTTPException: Wrong token
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = _decode_email_token(token)
         password = payload["password"]
         return password
     except JWTError as e:
@@ -2,6 +2,7 @@ from typing import List
 
 from fastapi import HTTPException, status
 from fastapi.openapi.models import Contact
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
@@ -33,12 +34,24 @@ class ContactService:
         Raises:
             HTTPException: If contact with the same email or phone number already exists.
         """
-        if await self.repository.is_contact_exists(body.email, body.phone_number, user):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Contact with '{body.email}' email or '{body.phone_number}' phone number already exists.",
-            )
-        return await self.repository.create_contact(body, user)
+        try:
+            return await self.repository.create_contact(body, user)
+        except IntegrityError as err:
+            # Only unique violations on the contacts email/phone columns mean
+            # a duplicate; anything else (FK failures, other constraints) is
+            # not the client's fault and must not be reported as one.
+            origin = str(getattr(err, "orig", None) or err).lower()
+            if "unique" in origin and (
+                "contacts.email" in origin
+                or "contacts.phone_number" in origin
+                or "contacts_email" in origin
+                or "contacts_phone_number" in origin
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Contact with '{body.email}' email or '{body.phone_number}' phone number already exists.",
+                )
+            raise
 
     async def get_contacts(
         self,
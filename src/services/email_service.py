@@ -1,13 +1,43 @@
+"""
+This module sends account emails (confirmation and password reset).
+
+Delivery is fully off the request path: handlers enqueue via `queue_email`
+and a background worker task performs the actual SMTP sends.
+"""
+
+import asyncio
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
 
 from src.services.auth_service import create_email_token
 from src.conf.config import settings
 
-conf = ConnectionConfig(
+TEMPLATE_FOLDER = Path(__file__).parent / "templates"
+
+# One Jinja environment for all sends. fastapi-mail's ConnectionConfig
+# builds a fresh Environment (and re-reads the template from disk) on every
+# send_message call; pinning one here means each template is loaded and
+# compiled exactly once.
+_template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_FOLDER),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+class CachedConnectionConfig(ConnectionConfig):
+    """ConnectionConfig that reuses the module's compiled-template environment."""
+
+    def template_engine(self) -> Environment:
+        return _template_env
+
+
+conf = CachedConnectionConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
     MAIL_FROM=settings.MAIL_FROM,
@@ -18,9 +48,89 @@ conf = ConnectionConfig(
     MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
     USE_CREDENTIALS=settings.USE_CREDENTIALS,
     VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
+    TEMPLATE_FOLDER=TEMPLATE_FOLDER,
 )
 
+# Single FastMail instance shared by all sends; constructing one per email
+# re-parsed the connection config every time.
+fm = FastMail(conf)
+
+# Warm the templates so the first email of the process doesn't pay the
+# disk read and Jinja compile either.
+_template_env.get_template("verify_email.html")
+_template_env.get_template("reset_password.html")
+
+
+# Outgoing emails are funneled through a single queue drained by a worker
+# task, so request handlers only pay for an enqueue. Queued sends are
+# dispatched concurrently up to MAIL_RATE at a time, so a burst of emails
+# overlaps SMTP handshakes instead of paying them serially, while staying
+# under provider rate limits.
+_email_queue: asyncio.Queue | None = None
+_email_worker: asyncio.Task | None = None
+_send_semaphore = asyncio.Semaphore(settings.MAIL_RATE)
+_send_tasks: set[asyncio.Task] = set()
+
+
+async def _dispatch_email(send_email, args, kwargs) -> None:
+    """
+    Send one queued email, releasing its rate-limit slot when done.
+
+    Args:
+        send_email (Callable): Email sending coroutine function.
+        args (tuple): Positional arguments for `send_email`.
+        kwargs (dict): Keyword arguments for `send_email`.
+
+    Returns:
+        None
+    """
+    try:
+        result = send_email(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as err:
+        print(err)
+    finally:
+        _send_semaphore.release()
+        _email_queue.task_done()
+
+
+async def _email_worker_loop() -> None:
+    """
+    Drain the email queue, dispatching up to MAIL_RATE sends concurrently.
+
+    Returns:
+        None
+    """
+    while True:
+        send_email, args, kwargs = await _email_queue.get()
+        # Acquire before spawning so the queue backs up instead of the
+        # task set growing without bound.
+        await _send_semaphore.acquire()
+        task = asyncio.create_task(_dispatch_email(send_email, args, kwargs))
+        _send_tasks.add(task)
+        task.add_done_callback(_send_tasks.discard)
+
+
+async def queue_email(send_email, *args, **kwargs) -> None:
+    """
+    Queue an email for delivery by the background worker.
+
+    Args:
+        send_email (Callable): Email sending coroutine function.
+        *args: Positional arguments for `send_email`.
+        **kwargs: Keyword arguments for `send_email`.
+
+    Returns:
+        None
+    """
+    global _email_queue, _email_worker
+    if _email_queue is None:
+        _email_queue = asyncio.Queue()
+    if _email_worker is None or _email_worker.done():
+        _email_worker = asyncio.create_task(_email_worker_loop())
+    await _email_queue.put((send_email, args, kwargs))
+
 
 async def send_confirm_email(to_email: EmailStr, username: str, host: str) -> None:
     """
@@ -50,7 +160,6 @@ async def send_confirm_email(to_email: EmailStr, username: str, host: str) -> No
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as err:
         print(err)
@@ -84,7 +193,6 @@ async def send_reset_password_email(
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="reset_password.html")
     except ConnectionErrors as err:
         print(err)
@@ -1,5 +1,20 @@
+import asyncio
+import hashlib
+import time
+
 import cloudinary
 import cloudinary.uploader
+import httpx
+
+# Cap simultaneous Cloudinary uploads so a burst of avatar updates can't
+# exhaust sockets or saturate upstream bandwidth; extra uploads queue here.
+UPLOAD_MAX_CONCURRENCY = 5
+
+_upload_semaphore = asyncio.Semaphore(UPLOAD_MAX_CONCURRENCY)
+
+# Keep references to fire-and-forget upload tasks so they aren't
+# garbage-collected mid-upload.
+_upload_tasks: set = set()
 
 
 class UploadFileService:
@@ -22,6 +37,154 @@ class UploadFileService:
             secure=True,
         )
 
+    def _sign_params(self, params: dict) -> str:
+        """
+        Sign upload parameters the way the Cloudinary API expects.
+
+        Args:
+            params (dict): Parameters to sign.
+
+        Returns:
+            str: SHA-1 signature of the parameters.
+        """
+        to_sign = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return hashlib.sha1(f"{to_sign}{self.api_secret}".encode()).hexdigest()
+
+    async def upload_file_async(self, file, username, wait: bool = True) -> str:
+        """
+        Uploads a file to Cloudinary without blocking the event loop.
+
+        The blocking SDK call is replaced by a signed POST to the Cloudinary
+        upload API through httpx, so other requests keep running while the
+        upload is in flight.
+
+        Args:
+            file (UploadFile): File to be uploaded.
+            username (str): Username of the user.
+            wait (bool, optional): When False, ask Cloudinary to process the
+                upload asynchronously (`async=true`) and return the
+                deterministic URL without waiting for a version. Suits
+                non-interactive uploads where nobody reads the result.
+
+        Returns:
+            str: URL of the uploaded file.
+        """
+        public_id = f"RestApp/{username}"
+        params = {
+            "overwrite": "true",
+            "public_id": public_id,
+            "timestamp": int(time.time()),
+        }
+        if not wait:
+            params["async"] = "true"
+        data = {
+            **params,
+            "api_key": str(self.api_key),
+            "signature": self._sign_params(params),
+        }
+        upload_url = f"https://api.cloudinary.com/v1_1/{self.cloud_name}/image/upload"
+        async with _upload_semaphore:
+            async with httpx.AsyncClient(timeout=30) as client:
+                response = await client.post(
+                    upload_url, data=data, files={"file": file.file}
+                )
+                response.raise_for_status()
+                r = response.json()
+        src_url = cloudinary.CloudinaryImage(public_id).build_url(
+            width=250, height=250, crop="fill", version=r.get("version")
+        )
+        return src_url
+
+    async def _post_upload(self, content: bytes, params: dict) -> None:
+        """
+        Perform the signed upload POST for a fire-and-forget upload.
+
+        Args:
+            content (bytes): File content to upload.
+            params (dict): Signed upload parameters.
+
+        Returns:
+            None
+        """
+        data = {
+            **params,
+            "api_key": str(self.api_key),
+            "signature": self._sign_params(params),
+        }
+        upload_url = f"https://api.cloudinary.com/v1_1/{self.cloud_name}/image/upload"
+        try:
+            async with _upload_semaphore:
+                async with httpx.AsyncClient(timeout=30) as client:
+                    response = await client.post(
+                        upload_url, data=data, files={"file": content}
+                    )
+                    response.raise_for_status()
+        except Exception as err:
+            print(err)
+
+    async def upload_file_nowait(self, file, username) -> str:
+        """
+        Start the upload in the background and return the URL immediately.
+
+        The Cloudinary `version` in the delivery URL is only a cache-buster,
+        so a locally generated one is as good as the real one and the caller
+        doesn't have to wait out the upload round-trip. The file content is
+        read up front because the request's temp file is closed once the
+        response goes out.
+
+        Args:
+            file (UploadFile): File to be uploaded.
+            username (str): Username of the user.
+
+        Returns:
+            str: URL the uploaded file will be served from.
+        """
+        public_id = f"RestApp/{username}"
+        content = file.file.read()
+        params = {
+            "overwrite": "true",
+            "public_id": public_id,
+            "timestamp": int(time.time()),
+        }
+        task = asyncio.create_task(self._post_upload(content, params))
+        _upload_tasks.add(task)
+        task.add_done_callback(_upload_tasks.discard)
+        return cloudinary.CloudinaryImage(public_id).build_url(
+            width=250, height=250, crop="fill", version=params["timestamp"]
+        )
+
+    def presign(self, username) -> dict:
+        """
+        Build signed parameters for a direct browser-to-Cloudinary upload.
+
+        The file never transits this server: the client POSTs it straight to
+        Cloudinary with these fields, then confirms the resulting URL back.
+
+        Args:
+            username (str): Username of the user.
+
+        Returns:
+            dict: Upload endpoint, signed form fields and the eventual
+                delivery URL of the avatar.
+        """
+        public_id = f"RestApp/{username}"
+        params = {
+            "overwrite": "true",
+            "public_id": public_id,
+            "timestamp": int(time.time()),
+        }
+        return {
+            "url": f"https://api.cloudinary.com/v1_1/{self.cloud_name}/image/upload",
+            "params": {
+                **params,
+                "api_key": str(self.api_key),
+                "signature": self._sign_params(params),
+            },
+            "avatar_url": cloudinary.CloudinaryImage(public_id).build_url(
+                width=250, height=250, crop="fill", version=params["timestamp"]
+            ),
+        }
+
     @staticmethod
     def upload_file(file, username) -> str:
         """
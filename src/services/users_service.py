@@ -1,10 +1,63 @@
+import hashlib
+from functools import lru_cache
+
+from aiocache import Cache
+from aiocache.serializers import PickleSerializer
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
+from src.conf.config import settings
 from src.database.models import User
 from src.repository.users_repository import UserRepository
 from src.schemas.users import UserCreate
 
+# Read-through cache for user lookups on the hot auth path. Backed by Redis
+# when REDIS_HOST is configured so all workers share one cache; falls back to
+# an in-process memory cache otherwise. Entries are short-lived and deleted
+# on every user mutation, so staleness is bounded by USER_CACHE_TTL.
+USER_CACHE_TTL = 60  # seconds
+
+
+def _build_user_cache() -> Cache:
+    """
+    Build the user cache backend, preferring Redis when configured
+
+    Returns:
+        Cache: Redis-backed cache, or an in-memory cache as fallback
+    """
+    if settings.REDIS_HOST:
+        try:
+            return Cache(
+                Cache.REDIS,
+                endpoint=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                namespace="user",
+                serializer=PickleSerializer(),
+            )
+        except Exception:
+            pass
+    return Cache(Cache.MEMORY, namespace="user", serializer=PickleSerializer())
+
+
+_user_cache = _build_user_cache()
+
+
+@lru_cache(maxsize=1024)
+def _gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar URL for an email, caching the result per email
+
+    A Gravatar URL is just an MD5 digest of the normalized email, so it is
+    built directly instead of going through the libgravatar wrapper.
+
+    Args:
+        email (str): email of the user
+
+    Returns:
+        str: Gravatar URL
+    """
+    digest = hashlib.md5(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}"
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -16,6 +69,22 @@ class UserService:
         """
         self.repository = UserRepository(db)
 
+    @staticmethod
+    async def _invalidate_user_cache(user: User | None) -> None:
+        """
+        Drop cached lookups for a user after a mutation
+
+        Args:
+            user (User | None): Mutated user, or None to skip
+
+        Returns:
+            None
+        """
+        if user is None:
+            return
+        await _user_cache.delete(f"u:{user.username}")
+        await _user_cache.delete(f"i:{user.id}")
+
     async def create_user(self, body: UserCreate) -> User:
         """
         Create a new user
@@ -29,13 +98,7 @@ class UserService:
         Raises:
             ValueError
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except ValueError as e:
-            print(e)
-
+        avatar = _gravatar_url(body.email)
         return await self.repository.create_user(body, avatar)
 
     async def get_user_by_id(self, user_id: int) -> User | None:
@@ -48,7 +111,13 @@ class UserService:
         Returns:
             User: User or None if not found
         """
-        return await self.repository.get_user_by_id(user_id)
+        key = f"i:{user_id}"
+        user = await _user_cache.get(key)
+        if user is None:
+            user = await self.repository.get_user_by_id(user_id)
+            if user is not None:
+                await _user_cache.set(key, user, ttl=USER_CACHE_TTL)
+        return user
 
     async def get_user_by_username(self, username: str) -> User | None:
         """
@@ -60,7 +129,13 @@ class UserService:
         Returns:
             User: User or None if not found
         """
-        return await self.repository.get_user_by_username(username)
+        key = f"u:{username}"
+        user = await _user_cache.get(key)
+        if user is None:
+            user = await self.repository.get_user_by_username(username)
+            if user is not None:
+                await _user_cache.set(key, user, ttl=USER_CACHE_TTL)
+        return user
 
     async def get_user_by_email(self, email: str) -> User | None:
         """
@@ -74,6 +149,21 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Returns a user matching either an email or a username
+
+        Args:
+            email (str): email of the user
+            username (str): username of the user
+
+        Returns:
+            User: User or None if not found
+        """
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str) -> None:
         """
         Mark an email as confirmed.
@@ -84,7 +174,10 @@ class UserService:
         Returns:
             None
         """
-        return await self.repository.confirmed_email(email)
+        await self.repository.confirmed_email(email)
+        await self._invalidate_user_cache(
+            await self.repository.get_user_by_email(email)
+        )
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
@@ -97,7 +190,9 @@ class UserService:
         Returns:
             A User object with the updated avatar URL.
         """
-        return await self.repository.update_avatar_url(email, url)
+        user = await self.repository.update_avatar_url(email, url)
+        await self._invalidate_user_cache(user)
+        return user
 
     async def reset_password(self, user_id: int, password: str) -> User:
         """
@@ -110,4 +205,6 @@ class UserService:
         Returns:
             A User object with the updated password.
         """
-        return await self.repository.reset_password(user_id, password)
+        user = await self.repository.reset_password(user_id, password)
+        await self._invalidate_user_cache(user)
+        return user
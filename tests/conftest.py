@@ -1,10 +1,18 @@
 import asyncio
+import os
+import sqlite3
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+# Tests don't need real password security; the bcrypt minimum keeps seeding
+# fast. Must be set before the app imports configure CryptContext below.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 import pytest_asyncio
+from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
@@ -12,9 +20,23 @@ from main import app
 from src.database.models import Base, User, Contact
 from src.database.db import get_db
 from src.schemas.contacts import ContactModel
-from src.services.auth_service import create_access_token, Hash
+from src.conf import messages
+from src.services import auth_service, users_service
+from src.services.auth_service import create_access_token, get_current_user, Hash
+
+# Shared-cache in-memory database: every connection attaches to the same
+# memory database, so fixtures and test client requests see one schema and
+# nothing is written (or fsynced) to disk. The plain sqlite3 anchor connection
+# keeps the database alive for the whole process — tests and fixtures run on
+# several event loops, and async connections are dropped when their loop
+# closes, which would otherwise wipe the data between fixtures and tests.
+SQLALCHEMY_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+)
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+_db_anchor = sqlite3.connect(
+    "file:testdb?mode=memory&cache=shared", uri=True, check_same_thread=False
+)
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -33,6 +55,23 @@ test_user = {
     "role": "user",
 }
 
+# One bcrypt hash shared by every module's seeded user; hashing per module
+# added a bcrypt invocation to each fixture setup for the same password.
+_SEED_PW_HASH = Hash().get_password_hash(test_user["password"])
+
+# User the authenticated integration tests act as; the override_auth fixture
+# returns it from the get_current_user dependency without touching JWT
+# decoding or the database.
+mock_user = {
+    "id": 1,
+    "username": "agent007",
+    "email": "agent007@gmail.com",
+    "password": "12345678",
+    "role": "user",
+    "confirmed": True,
+    "avatar": "https://example.com/avatar.png",
+}
+
 user_data = {
     "username": "agent007",
     "email": "agent007@gmail.com",
@@ -55,6 +94,54 @@ user_data_unique = {
 }
 
 
+class AsyncStub:
+    """
+    Minimal async callable standing in for AsyncMock.
+
+    Carries none of AsyncMock's call-history/spec/child-mock machinery, so
+    it is much cheaper to build and invoke; use it where a test only needs
+    the return value and a single-call assertion.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], (
+            f"expected exactly one call with {args}, {kwargs}; got {self.calls}"
+        )
+
+
+def execute_result(*, scalars_all=None, scalar_one=None, scalars_first=None):
+    """
+    Build a lightweight stand-in for a SQLAlchemy execute() result.
+
+    Cheaper than a MagicMock chain and spells out exactly which accessors the
+    code under test may use.
+
+    Args:
+        scalars_all: Value returned by `.scalars().all()`.
+        scalar_one: Value returned by `.scalar_one_or_none()`.
+        scalars_first: Value returned by `.scalars().first()`.
+
+    Returns:
+        SimpleNamespace: Object mimicking the result interface.
+    """
+    scalars = SimpleNamespace(
+        all=lambda: scalars_all,
+        first=lambda: scalars_first,
+    )
+    return SimpleNamespace(
+        scalars=lambda: scalars,
+        scalar_one_or_none=lambda: scalar_one,
+    )
+
+
 @pytest.fixture
 def user():
     return User(id=1, username="testuser", role="user")
@@ -96,11 +183,10 @@ def init_models_wrap():
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
         async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
-                hashed_password=hash_password,
+                hashed_password=_SEED_PW_HASH,
                 confirmed=True,
                 avatar="https://twitter.com/gravatar.jpg",
                 role=test_user["role"],
@@ -113,7 +199,7 @@ def init_models_wrap():
     asyncio.run(init_models())
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client():
     # Dependency override
 
@@ -130,13 +216,89 @@ def client():
     yield TestClient(app)
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def aclient():
+    """
+    Async test client driving the app in-process through ASGITransport.
+
+    Unlike TestClient there is no thread portal per request, so request-heavy
+    integration modules run noticeably faster.
+    """
+
+    async def override_get_db():
+        async with TestingSessionLocal() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def raise_unauthorized():
+    """
+    Dependency override simulating a request without valid credentials.
+
+    Raises exactly what get_current_user raises, so requests fail fast in
+    dependency resolution — no JWT decoding, no database or service work —
+    while the response stays indistinguishable from the real rejection.
+    """
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=messages.UNAUTHORIZED,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def override_auth():
+    """
+    Authenticate every request as mock_user via a dependency override.
+
+    One override for the whole session replaces the per-test monkeypatching
+    of jwt.decode and get_user_from_db the integration tests used to do.
+    Unauthenticated tests swap in raise_unauthorized with monkeypatch.setitem.
+    """
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 @pytest.fixture
-def auth_headers():
+def mocked_auth(monkeypatch):
+    """
+    Factory that authenticates requests as a given user for one test.
+
+    The session-wide override_auth fixture signs every request in as
+    mock_user; tests that need a different identity (another role, an
+    unconfirmed account) call this factory instead of re-patching auth
+    internals themselves. The override is undone with the test's
+    monkeypatch, so the session default comes back afterwards.
+    """
+
+    def _authenticate_as(user=mock_user):
+        monkeypatch.setitem(
+            app.dependency_overrides, get_current_user, lambda: user
+        )
+        return user
+
+    return _authenticate_as
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
     """
-    Fixture for auth headers
+    Clear the verified-token and user caches so every test starts cold.
     """
-    token = "test_token"
-    return {"Authorization": f"Bearer {token}"}
+    auth_service._token_cache.clear()
+    auth_service._token_locks.clear()
+    users_service._user_cache._cache.clear()
+    yield
 
 
 @pytest.fixture
@@ -150,17 +312,18 @@ def fake_upload_file():
     return mock_file
 
 
-@pytest.fixture(scope="module")
-def event_loop():
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def dispose_engine():
     """
-    Використовуйте модульну область видимості для event_loop.
+    Dispose the shared async engine once the whole session is done.
     """
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+    yield
+    await engine.dispose()
 
 
-@pytest_asyncio.fixture()
+@pytest_asyncio.fixture(scope="session")
 async def get_token():
+    # Signing is deterministic for the seeded user, so one token serves the
+    # whole session instead of re-running JWT encoding per test.
     token = await create_access_token(data={"sub": test_user["username"]})
     return token
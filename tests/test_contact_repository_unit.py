@@ -1,10 +1,11 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.repository.contacts_repository import ContactRepository
 from src.schemas.contacts import ContactModel
+from tests.conftest import execute_result
 
 
 @pytest.fixture
@@ -52,12 +53,9 @@ def contact_body():
     )
 
 
-@pytest.mark.asyncio
 async def test_get_contacts(contact_repository, mock_session, user, contact):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [contact]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(return_value=execute_result(scalars_all=[contact]))
 
     # Call method
     contacts = await contact_repository.get_contacts(
@@ -74,12 +72,9 @@ async def test_get_contacts(contact_repository, mock_session, user, contact):
     assert contacts[0].first_name == "Bob"
 
 
-@pytest.mark.asyncio
 async def test_get_contact_by_id(contact_repository, mock_session, user, contact):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(return_value=execute_result(scalar_one=contact))
 
     # Call method
     contact_record = await contact_repository.get_contact_by_id(contact_id=1, user=user)
@@ -90,7 +85,6 @@ async def test_get_contact_by_id(contact_repository, mock_session, user, contact
     assert contact_record.first_name == "Bob"
 
 
-@pytest.mark.asyncio
 async def test_create_contact_successful(
     contact_repository, mock_session, user, contact_body
 ):
@@ -103,10 +97,9 @@ async def test_create_contact_successful(
     assert result.first_name == "Bob"
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_create_contact_failure(
     contact_repository, mock_session, user, contact_body
 ):
@@ -119,17 +112,14 @@ async def test_create_contact_failure(
     assert result.first_name != "Bob2"
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user, contact):
     # Setup
     contact_data = ContactModel(**contact.__dict__)
     contact_data.first_name = "Bob2"
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(return_value=execute_result(scalar_one=contact))
 
     # Call method
     result = await contact_repository.update_contact(
@@ -137,18 +127,15 @@ async def test_update_contact(contact_repository, mock_session, user, contact):
     )
 
     # Assertions
-    assert result is not None
-    assert result.first_name == "Bob2"
+    assert result is contact
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(contact)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_remove_contact(contact_repository, mock_session, user, contact):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(return_value=execute_result(scalar_one=contact))
 
     # Call method
     result = await contact_repository.remove_contact(contact_id=1, user=user)
@@ -160,14 +147,11 @@ async def test_remove_contact(contact_repository, mock_session, user, contact):
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_is_contact_exists_success(
     contact_repository, mock_session, user, contact
 ):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(return_value=execute_result(scalars_first=contact))
 
     is_contact_exist = await contact_repository.is_contact_exists(
         "aassdd@example.com", "111-11-11", user=user
@@ -177,14 +161,13 @@ async def test_is_contact_exists_success(
     assert is_contact_exist is True
 
 
-@pytest.mark.asyncio
 async def test_is_contact_exists_failure(
     contact_repository, mock_session, user, contact_none
 ):
     # Setup
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = contact_none
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute = AsyncMock(
+        return_value=execute_result(scalars_first=contact_none)
+    )
 
     is_contact_exist = await contact_repository.is_contact_exists(
         "aassdd@example.com", "111-11-11", user=user
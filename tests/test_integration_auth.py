@@ -4,8 +4,10 @@ import pytest
 
 from sqlalchemy import select
 
+from main import app
 from src.conf import messages
 from src.database.models import User
+from src.services.auth_service import get_current_user
 from tests.conftest import TestingSessionLocal
 
 user_data = {
@@ -30,10 +32,10 @@ user_data_unique = {
 }
 
 
-def test_signup(client, monkeypatch):
+async def test_signup(aclient, monkeypatch):
     mock_send_email = Mock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+    response = await aclient.post("api/auth/register", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
@@ -43,33 +45,33 @@ def test_signup(client, monkeypatch):
     assert data["role"] == user_data["role"]
 
 
-def test_signup_same_email(client, monkeypatch):
+async def test_signup_same_email(aclient, monkeypatch):
     mock_send_email = Mock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+    response = await aclient.post("api/auth/register", json=user_data)
     assert response.status_code == 409, response.text
     assert response.json()["detail"] == messages.USER_EMAIL_ALREADY_EXISTS
 
 
-def test_signup_same_username(client, monkeypatch):
+async def test_signup_same_username(aclient, monkeypatch):
     mock_send_email = Mock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data_unique_email)
+    response = await aclient.post("api/auth/register", json=user_data_unique_email)
     assert response.status_code == 409, response.text
     assert response.json()["detail"] == messages.USER_NAME_ALREADY_EXISTS
 
 
-def test_repeat_signup(client, monkeypatch):
+async def test_repeat_signup(aclient, monkeypatch):
     mock_send_email = Mock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+    response = await aclient.post("api/auth/register", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == messages.USER_EMAIL_ALREADY_EXISTS
 
 
-def test_not_confirmed_login(client):
-    response = client.post(
+async def test_not_confirmed_login(aclient):
+    response = await aclient.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
@@ -81,8 +83,7 @@ def test_not_confirmed_login(client):
     assert data["detail"] == messages.USER_NOT_CONFIRMED
 
 
-@pytest.mark.asyncio
-async def test_login(client):
+async def test_login(aclient):
     async with TestingSessionLocal() as session:
         current_user = await session.execute(
             select(User).where(User.email == user_data.get("email"))
@@ -92,7 +93,7 @@ async def test_login(client):
             current_user.confirmed = True
             await session.commit()
 
-    response = client.post(
+    response = await aclient.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
@@ -105,8 +106,78 @@ async def test_login(client):
     assert "token_type" in data
 
 
-def test_wrong_password_login(client):
-    response = client.post(
+async def test_me_with_real_token(aclient, monkeypatch):
+    # Remove the session-wide auth override so the real get_current_user
+    # dependency runs: the token from login must rebuild the user from its
+    # claims and validate against the User response schema.
+    monkeypatch.delitem(app.dependency_overrides, get_current_user)
+
+    response = await aclient.post(
+        "api/auth/login",
+        data={
+            "username": user_data.get("username"),
+            "password": user_data.get("password"),
+        },
+    )
+    assert response.status_code == 200, response.text
+    token = response.json()["access_token"]
+
+    response = await aclient.get(
+        "api/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["username"] == user_data["username"]
+    assert data["email"] == user_data["email"]
+    assert data["avatar"] is not None
+
+
+async def test_create_contact_with_real_token(aclient, monkeypatch):
+    # A real contact write must work with the claims-built user: handing the
+    # transient ORM instance to the insert used to cascade an INSERT over the
+    # existing users row and fail every POST /api/contacts/.
+    monkeypatch.delitem(app.dependency_overrides, get_current_user)
+
+    response = await aclient.post(
+        "api/auth/login",
+        data={
+            "username": user_data.get("username"),
+            "password": user_data.get("password"),
+        },
+    )
+    assert response.status_code == 200, response.text
+    token = response.json()["access_token"]
+
+    contact = {
+        "first_name": "Real",
+        "last_name": "Token",
+        "email": "real.token@example.com",
+        "phone_number": "555-000-1111",
+        "birth_date": "1990-01-01",
+    }
+    response = await aclient.post(
+        "api/contacts/",
+        json=contact,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert data["email"] == contact["email"]
+    assert data["first_name"] == contact["first_name"]
+
+    # A repeated insert hits the real unique constraint and must surface as
+    # the duplicate-contact 400, not anything else.
+    response = await aclient.post(
+        "api/contacts/",
+        json=contact,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 400, response.text
+    assert contact["email"] in response.json()["detail"]
+
+
+async def test_wrong_password_login(aclient):
+    response = await aclient.post(
         "api/auth/login",
         data={"username": user_data.get("username"), "password": "password"},
     )
@@ -115,8 +186,8 @@ def test_wrong_password_login(client):
     assert data["detail"] == messages.INVALID_CREDENTIALS
 
 
-def test_wrong_username_login(client):
-    response = client.post(
+async def test_wrong_username_login(aclient):
+    response = await aclient.post(
         "api/auth/login",
         data={"username": "username", "password": user_data.get("password")},
     )
@@ -125,8 +196,8 @@ def test_wrong_username_login(client):
     assert data["detail"] == messages.INVALID_CREDENTIALS
 
 
-def test_validation_error_login(client):
-    response = client.post(
+async def test_validation_error_login(aclient):
+    response = await aclient.post(
         "api/auth/login", data={"password": user_data.get("password")}
     )
     assert response.status_code == 422, response.text
@@ -134,8 +205,7 @@ def test_validation_error_login(client):
     assert "detail" in data
 
 
-@pytest.mark.asyncio
-async def test_confirm_email(client, monkeypatch):
+async def test_confirm_email(aclient, monkeypatch):
     mock_get_email_from_token = AsyncMock(return_value="test_user@gmail.com")
     monkeypatch.setattr("src.api.auth.get_email_from_token", mock_get_email_from_token)
 
@@ -145,7 +215,7 @@ async def test_confirm_email(client, monkeypatch):
     monkeypatch.setattr("src.api.auth.UserService", lambda db: mock_user_service)
 
     # API calls
-    response = client.get("api/auth/confirmed_email/token")
+    response = await aclient.get("api/auth/confirmed_email/token")
     assert response.status_code == 200
     assert response.json()["message"] == messages.EMAIL_CONFIRMED
 
@@ -155,8 +225,7 @@ async def test_confirm_email(client, monkeypatch):
     mock_user_service.confirmed_email.assert_called_once_with("test_user@gmail.com")
 
 
-@pytest.mark.asyncio
-async def test_confirm_email_already_confirmed(client, monkeypatch):
+async def test_confirm_email_already_confirmed(aclient, monkeypatch):
     # Mocking the function to get the email from the token
     mock_get_email_from_token = AsyncMock(return_value="test_user@gmail.com")
     monkeypatch.setattr("src.api.auth.get_email_from_token", mock_get_email_from_token)
@@ -168,7 +237,7 @@ async def test_confirm_email_already_confirmed(client, monkeypatch):
     monkeypatch.setattr("src.api.auth.UserService", lambda db: mock_user_service)
 
     # API calls
-    response = client.get("api/auth/confirmed_email/token")
+    response = await aclient.get("api/auth/confirmed_email/token")
 
     # Asserts
     assert response.status_code == 200
@@ -181,16 +250,15 @@ async def test_confirm_email_already_confirmed(client, monkeypatch):
     mock_user_service.confirmed_email.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_request_email(client, monkeypatch):
+async def test_request_email(aclient, monkeypatch):
     # Setup mock
     mock_send_email = AsyncMock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
 
     # create new user (not activated)
-    client.post("api/auth/register", json=user_data_unique)
+    await aclient.post("api/auth/register", json=user_data_unique)
     # request new activation email call
-    response = client.post(
+    response = await aclient.post(
         "api/auth/request_email", json={"email": user_data_unique["email"]}
     )
 
@@ -199,21 +267,19 @@ async def test_request_email(client, monkeypatch):
     assert response.json()["message"] == messages.CHECK_YOUR_EMAIL
 
 
-@pytest.mark.asyncio
-async def test_request_email_already_confirmed(client, monkeypatch):
+async def test_request_email_already_confirmed(aclient, monkeypatch):
     mock_send_email = AsyncMock()
     monkeypatch.setattr("src.api.auth.send_confirm_email", mock_send_email)
 
     # API call
-    response = client.post("api/auth/request_email", json={"email": user_data["email"]})
+    response = await aclient.post("api/auth/request_email", json={"email": user_data["email"]})
 
     # Check calls
     assert response.status_code == 200
     assert response.json()["message"] == messages.EMAIL_ALREADY_CONFIRMED
 
 
-@pytest.mark.asyncio
-async def test_confirm_reset_password(client, monkeypatch):
+async def test_confirm_reset_password(aclient, monkeypatch):
     # Mock the function to get email and password from the token
     mock_get_email_from_token = AsyncMock(return_value="test_user@gmail.com")
     mock_get_password_from_token = AsyncMock(return_value="new_hashed_password")
@@ -234,7 +300,7 @@ async def test_confirm_reset_password(client, monkeypatch):
     monkeypatch.setattr("src.api.auth.UserService", lambda db: mock_user_service)
 
     # API call to reset password
-    response = client.get("api/auth/confirm_reset_password/token")
+    response = await aclient.get("api/auth/confirm_reset_password/token")
 
     # Assertions
     assert response.status_code == 200
@@ -247,8 +313,7 @@ async def test_confirm_reset_password(client, monkeypatch):
     mock_user_service.reset_password.assert_called_once_with(1, "new_hashed_password")
 
 
-@pytest.mark.asyncio
-async def test_confirm_reset_password_invalid_token(client, monkeypatch):
+async def test_confirm_reset_password_invalid_token(aclient, monkeypatch):
     # Mock the function to simulate an invalid token (returns None for email and password)
     mock_get_email_from_token = AsyncMock(return_value=None)
     mock_get_password_from_token = AsyncMock(return_value=None)
@@ -258,7 +323,7 @@ async def test_confirm_reset_password_invalid_token(client, monkeypatch):
     )
 
     # API call to attempt password reset with invalid token
-    response = client.get("api/auth/confirm_reset_password/token")
+    response = await aclient.get("api/auth/confirm_reset_password/token")
 
     # Assertions
     assert response.status_code == 400
@@ -269,8 +334,7 @@ async def test_confirm_reset_password_invalid_token(client, monkeypatch):
     mock_get_password_from_token.assert_called_once_with("token")
 
 
-@pytest.mark.asyncio
-async def test_confirm_reset_password_user_not_found(client, monkeypatch):
+async def test_confirm_reset_password_user_not_found(aclient, monkeypatch):
     # Mock the function to get email and password from the token
     mock_get_email_from_token = AsyncMock(return_value="test_user@gmail.com")
     mock_get_password_from_token = AsyncMock(return_value="new_hashed_password")
@@ -285,7 +349,7 @@ async def test_confirm_reset_password_user_not_found(client, monkeypatch):
     monkeypatch.setattr("src.api.auth.UserService", lambda db: mock_user_service)
 
     # API call to reset password
-    response = client.get("api/auth/confirm_reset_password/token")
+    response = await aclient.get("api/auth/confirm_reset_password/token")
 
     # Assertions
     assert response.status_code == 404
@@ -1,19 +1,16 @@
+import json
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from fastapi import HTTPException, status
+from unittest.mock import patch
+
+from main import app
 from src.conf import messages
 from src.schemas.contacts import ContactModel
+from src.services.auth_service import get_current_user
+from src.services.contacts_service import ContactService
+from tests.conftest import AsyncStub, mock_user as user_data, raise_unauthorized
 
-user_data = {
-    "id": 1,
-    "username": "agent007",
-    "email": "agent007@gmail.com",
-    "password": "12345678",
-    "role": "user",
-    "confirmed": True,
-}
-
-contacts = [
+contacts = (
     {
         "id": 1,
         "first_name": "John",
@@ -36,7 +33,7 @@ contacts = [
         "updated_at": "2023-01-01T00:00:00",
         "info": None,
     },
-]
+)
 
 payload = {
     "first_name": "John",
@@ -46,535 +43,297 @@ payload = {
     "phone_number": "123-456-7890",
 }
 
+update_payload = {
+    "first_name": "UpdatedJohn",
+    "last_name": "UpdatedDoe",
+    "birth_date": "1990-12-15",
+    "email": "john.doe@example.com",
+    "phone_number": "123-456-7890",
+}
 
-@pytest.mark.asyncio
-async def test_get_upcoming_birthdays(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return contacts with upcoming birthdays
-    mock_get_upcoming_birthdays = AsyncMock(return_value=contacts)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_upcoming_birthdays",
-        mock_get_upcoming_birthdays,
-    )
-
-    # API call
-    response = client.get("/api/contacts/birthdays?days=7", headers=auth_headers)
-
-    # Assertions
-    assert response.status_code == 200
-    assert len(response.json()) == len(contacts)
-    assert response.json()[0]["first_name"] == contacts[0]["first_name"]
-    mock_get_upcoming_birthdays.assert_called_once_with(7, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_upcoming_birthdays_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
-        )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call without authentication headers
-    response = client.get("/api/contacts/birthdays?days=7")
-
-    # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_get_contacts_no_filters(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return all contacts
-    mock_get_contacts = AsyncMock(return_value=contacts)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_contacts", mock_get_contacts
-    )
-
-    # API call
-    response = client.get("/api/contacts/", headers=auth_headers)
+nonexistent_payload = {
+    "first_name": "NonExistent",
+    "last_name": "Contact",
+    "birth_date": "1990-12-15",
+    "email": "nonexistent@example.com",
+    "phone_number": "123-456-7890",
+}
 
-    # Assertions
-    assert response.status_code == 200
-    assert len(response.json()) == len(contacts)
-    assert response.json()[0]["email"] == contacts[0]["email"]
-    mock_get_contacts.assert_called_once_with("", "", "", 0, 100, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_contacts_with_filters(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return filtered contacts
-    filtered_contacts = [contacts[0]]
-    mock_get_contacts = AsyncMock(return_value=filtered_contacts)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_contacts", mock_get_contacts
-    )
-
-    # API call with filters
-    response = client.get(
-        "/api/contacts/?first_name=John&last_name=Doe", headers=auth_headers
-    )
+# The payload dicts above are constants, so the ContactModel instances the
+# tests assert against are validated once at import instead of per test, and
+# the request bodies are serialized to JSON bytes once instead of per request.
+EXPECTED_CREATE_CONTACT = ContactModel(**payload)
+EXPECTED_UPDATED_CONTACT = ContactModel(**update_payload)
+EXPECTED_NONEXISTENT_CONTACT = ContactModel(**nonexistent_payload)
+
+UPDATED_CONTACT = {
+    **contacts[0],
+    "first_name": "UpdatedJohn",
+    "last_name": "UpdatedDoe",
+}
 
-    # Assertions
-    assert response.status_code == 200
-    assert len(response.json()) == len(filtered_contacts)
-    assert response.json()[0]["first_name"] == "John"
-    mock_get_contacts.assert_called_once_with("John", "Doe", "", 0, 100, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_contacts_pagination(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return paginated contacts
-    paginated_contacts = [
-        {
-            "id": 3,
-            "first_name": "Alice",
-            "last_name": "Smith",
-            "email": "alice.smith@example.com",
-            "phone_number": "987-654-3210",
-            "birth_date": "1995-05-15",
-            "created_at": "2023-01-01T00:00:00",
-            "updated_at": "2023-01-01T00:00:00",
+JSON_HEADERS = {"content-type": "application/json"}
+PAYLOAD_BYTES = json.dumps(payload).encode()
+UPDATE_PAYLOAD_BYTES = json.dumps(update_payload).encode()
+NONEXISTENT_PAYLOAD_BYTES = json.dumps(nonexistent_payload).encode()
+
+
+class TestContactsAPI:
+    """
+    Authenticated /api/contacts endpoint tests.
+
+    Auth is already patched once for the whole session by the autouse
+    override_auth fixture in conftest, so the class carries no setup of its
+    own; it only scopes the per-test ContactService stubs together.
+    """
+
+    async def test_get_upcoming_birthdays(self, aclient):
+        # Mock ContactService to return contacts with upcoming birthdays
+        with patch.object(
+            ContactService, "get_upcoming_birthdays", AsyncStub(contacts)
+        ) as mock_get_upcoming_birthdays:
+            # API call
+            response = await aclient.get("/api/contacts/birthdays?days=7")
+
+        # Assertions
+        assert response.status_code == 200
+        assert len(response.json()) == len(contacts)
+        assert response.json()[0]["first_name"] == contacts[0]["first_name"]
+        mock_get_upcoming_birthdays.assert_called_once_with(7, user_data)
+
+    async def test_get_contacts_no_filters(self, aclient):
+        # Mock ContactService to return all contacts
+        with patch.object(
+            ContactService, "get_contacts", AsyncStub(contacts)
+        ) as mock_get_contacts:
+            # API call
+            response = await aclient.get("/api/contacts/")
+
+        # Assertions
+        assert response.status_code == 200
+        assert len(response.json()) == len(contacts)
+        assert response.json()[0]["email"] == contacts[0]["email"]
+        mock_get_contacts.assert_called_once_with("", "", "", 0, 100, user_data)
+
+    async def test_get_contacts_with_filters(self, aclient):
+        # Mock ContactService to return filtered contacts
+        filtered_contacts = [contacts[0]]
+        with patch.object(
+            ContactService, "get_contacts", AsyncStub(filtered_contacts)
+        ) as mock_get_contacts:
+            # API call with filters
+            response = await aclient.get("/api/contacts/?first_name=John&last_name=Doe")
+
+        # Assertions
+        assert response.status_code == 200
+        assert len(response.json()) == len(filtered_contacts)
+        assert response.json()[0]["first_name"] == "John"
+        mock_get_contacts.assert_called_once_with("John", "Doe", "", 0, 100, user_data)
+
+    async def test_get_contacts_pagination(self, aclient):
+        # Mock ContactService to return paginated contacts
+        paginated_contacts = [
+            {
+                "id": 3,
+                "first_name": "Alice",
+                "last_name": "Smith",
+                "email": "alice.smith@example.com",
+                "phone_number": "987-654-3210",
+                "birth_date": "1995-05-15",
+                "created_at": "2023-01-01T00:00:00",
+                "updated_at": "2023-01-01T00:00:00",
+            }
+        ]
+        with patch.object(
+            ContactService, "get_contacts", AsyncStub(paginated_contacts)
+        ) as mock_get_contacts:
+            # API call with pagination parameters
+            response = await aclient.get("/api/contacts/?skip=2&limit=1")
+
+        # Assertions
+        assert response.status_code == 200
+        assert len(response.json()) == len(paginated_contacts)
+        assert response.json()[0]["id"] == 3
+        mock_get_contacts.assert_called_once_with("", "", "", 2, 1, user_data)
+
+    async def test_get_contact_success(self, aclient):
+        # Mock ContactService to return a contact
+        contact = contacts[0]
+        with patch.object(
+            ContactService, "get_contact", AsyncStub(contact)
+        ) as mock_get_contact:
+            # API call
+            response = await aclient.get("/api/contacts/1")
+
+        # Assertions
+        assert response.status_code == 200
+        assert response.json()["id"] == contact["id"]
+        assert response.json()["first_name"] == contact["first_name"]
+        mock_get_contact.assert_called_once_with(1, user_data)
+
+    async def test_get_contact_not_found(self, aclient):
+        # Mock ContactService to return None for a missing contact
+        with patch.object(
+            ContactService, "get_contact", AsyncStub(None)
+        ) as mock_get_contact:
+            # API call to a non-existent contact
+            response = await aclient.get("/api/contacts/999")
+
+        # Assertions
+        assert response.status_code == 404
+        assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
+        mock_get_contact.assert_called_once_with(999, user_data)
+
+    async def test_create_contact_success(self, aclient):
+        # Mock ContactService to simulate contact creation
+        new_contact = contacts[0]
+        with patch.object(
+            ContactService, "create_contact", AsyncStub(new_contact)
+        ) as mock_create_contact:
+            # API call
+            response = await aclient.post(
+                "/api/contacts/", content=PAYLOAD_BYTES, headers=JSON_HEADERS
+            )
+
+        # Assertions
+        assert response.status_code == 201
+        assert response.json()["id"] == new_contact["id"]
+        assert response.json()["first_name"] == new_contact["first_name"]
+        mock_create_contact.assert_called_once_with(EXPECTED_CREATE_CONTACT, user_data)
+
+    async def test_create_contact_invalid_data(self, aclient):
+        # Payload with invalid data
+        invalid_payload = {
+            "first_name": "",  # Missing required fields or invalid data
         }
-    ]
-    mock_get_contacts = AsyncMock(return_value=paginated_contacts)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_contacts", mock_get_contacts
-    )
-
-    # API call with pagination parameters
-    response = client.get("/api/contacts/?skip=2&limit=1", headers=auth_headers)
 
-    # Assertions
-    assert response.status_code == 200
-    assert len(response.json()) == len(paginated_contacts)
-    assert response.json()[0]["id"] == 3
-    mock_get_contacts.assert_called_once_with("", "", "", 2, 1, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_contacts_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
+        # API call
+        response = await aclient.post("/api/contacts/", json=invalid_payload)
+
+        # Assertions
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    async def test_update_contact_success(self, aclient):
+        # Mock ContactService to simulate contact update
+        with patch.object(
+            ContactService, "update_contact", AsyncStub(UPDATED_CONTACT)
+        ) as mock_update_contact:
+            contact_id = contacts[0]["id"]
+
+            # API call
+            response = await aclient.put(
+                f"/api/contacts/{contact_id}",
+                content=UPDATE_PAYLOAD_BYTES,
+                headers=JSON_HEADERS,
+            )
+
+        # Assertions
+        assert response.status_code == 200
+        assert response.json()["id"] == UPDATED_CONTACT["id"]
+        assert response.json()["first_name"] == UPDATED_CONTACT["first_name"]
+        assert response.json()["last_name"] == UPDATED_CONTACT["last_name"]
+        mock_update_contact.assert_called_once_with(
+            contact_id, EXPECTED_UPDATED_CONTACT, user_data
         )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call without authentication headers
-    response = client.get("/api/contacts/")
-
-    # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_get_contact_success(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return a contact
-    contact = contacts[0]
-    mock_get_contact = AsyncMock(return_value=contact)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_contact", mock_get_contact
-    )
-
-    # API call
-    response = client.get("/api/contacts/1", headers=auth_headers)
-
-    # Assertions
-    assert response.status_code == 200
-    assert response.json()["id"] == contact["id"]
-    assert response.json()["first_name"] == contact["first_name"]
-    mock_get_contact.assert_called_once_with(1, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_contact_not_found(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return None for a missing contact
-    mock_get_contact = AsyncMock(return_value=None)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.get_contact", mock_get_contact
-    )
-
-    # API call to a non-existent contact
-    response = client.get("/api/contacts/999", headers=auth_headers)
 
-    # Assertions
-    assert response.status_code == 404
-    assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
-    mock_get_contact.assert_called_once_with(999, user_data)
-
-
-@pytest.mark.asyncio
-async def test_get_contact_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
+    async def test_update_contact_not_found(self, aclient):
+        # Mock ContactService to return None for a missing contact
+        with patch.object(
+            ContactService, "update_contact", AsyncStub(None)
+        ) as mock_update_contact:
+            # API call with a non-existent contact ID
+            response = await aclient.put(
+                "/api/contacts/999",
+                content=NONEXISTENT_PAYLOAD_BYTES,
+                headers=JSON_HEADERS,
+            )
+
+        # Assertions
+        assert response.status_code == 404
+        assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
+        mock_update_contact.assert_called_once_with(
+            999, EXPECTED_NONEXISTENT_CONTACT, user_data
         )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call without authentication headers
-    response = client.get("/api/contacts/1")
-
-    # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_create_contact_success(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to simulate contact creation
-    new_contact = contacts[0]
-    mock_create_contact = AsyncMock(return_value=new_contact)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.create_contact",
-        mock_create_contact,
-    )
-
-    # API call
-    response = client.post("/api/contacts/", json=payload, headers=auth_headers)
-
-    expected_contact = ContactModel(**payload)
-
-    # Assertions
-    assert response.status_code == 201
-    assert response.json()["id"] == new_contact["id"]
-    assert response.json()["first_name"] == new_contact["first_name"]
-    mock_create_contact.assert_called_once_with(expected_contact, user_data)
-
-
-@pytest.mark.asyncio
-async def test_create_contact_invalid_data(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Payload with invalid data
-    invalid_payload = {
-        "first_name": "",  # Missing required fields or invalid data
-    }
-
-    # API call
-    response = client.post("/api/contacts/", json=invalid_payload, headers=auth_headers)
 
-    # Assertions
-    assert response.status_code == 422
-    assert "detail" in response.json()
-
-
-@pytest.mark.asyncio
-async def test_create_contact_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
-        )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call without authentication headers
-    response = client.post("/api/contacts/", json=payload)
-
-    # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_update_contact_success(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to simulate contact update
-    updated_contact = {
-        **contacts[0],
-        "first_name": "UpdatedJohn",
-        "last_name": "UpdatedDoe",
-    }
-    mock_update_contact = AsyncMock(return_value=updated_contact)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.update_contact",
-        mock_update_contact,
-    )
-
-    # Payload for updating the contact
-    payload = {
-        "first_name": "UpdatedJohn",
-        "last_name": "UpdatedDoe",
-        "birth_date": "1990-12-15",
-        "email": "john.doe@example.com",
-        "phone_number": "123-456-7890",
-    }
-
-    contact_id = contacts[0]["id"]
-
-    # API call
-    response = client.put(
-        f"/api/contacts/{contact_id}", json=payload, headers=auth_headers
-    )
-
-    expected_contact = ContactModel(**payload)
-
-    # Assertions
-    assert response.status_code == 200
-    assert response.json()["id"] == updated_contact["id"]
-    assert response.json()["first_name"] == updated_contact["first_name"]
-    assert response.json()["last_name"] == updated_contact["last_name"]
-    mock_update_contact.assert_called_once_with(contact_id, expected_contact, user_data)
-
-
-@pytest.mark.asyncio
-async def test_update_contact_not_found(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return None for a missing contact
-    mock_update_contact = AsyncMock(return_value=None)
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.update_contact",
-        mock_update_contact,
-    )
-
-    # Payload for updating the contact
-    payload = {
-        "first_name": "NonExistent",
-        "last_name": "Contact",
-        "birth_date": "1990-12-15",
-        "email": "nonexistent@example.com",
-        "phone_number": "123-456-7890",
-    }
-
-    # API call with a non-existent contact ID
-    response = client.put("/api/contacts/999", json=payload, headers=auth_headers)
-
-    expected_contact = ContactModel(**payload)
-    # Assertions
-    assert response.status_code == 404
-    assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
-    mock_update_contact.assert_called_once_with(999, expected_contact, user_data)
-
-
-@pytest.mark.asyncio
-async def test_update_contact_invalid_data(client, monkeypatch, auth_headers):
-    # Mock jwt.decode and user retrieval as before
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Payload with invalid data
-    invalid_payload = {
-        "first_name": "",  # Missing or invalid required fields
-    }
-
-    # API call with invalid data
-    response = client.put("/api/contacts/1", json=invalid_payload, headers=auth_headers)
-
-    # Assertions
-    assert response.status_code == 422
-    assert "detail" in response.json()
-
-
-@pytest.mark.asyncio
-async def test_update_contact_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
-        )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call without authentication headers
-    response = client.put("/api/contacts/1", json={})
-
-    # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
-
-
-@pytest.mark.asyncio
-async def test_delete_contact_success(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to simulate contact deletion
-    mock_delete_contact = AsyncMock(return_value=contacts[0])  # Successfully deleted
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.remove_contact",
-        mock_delete_contact,
-    )
-
-    # Contact ID to delete
-    contact_id = contacts[0]["id"]
-
-    # API call to delete the contact
-    response = client.delete(f"/api/contacts/{contact_id}", headers=auth_headers)
-
-    # Assertions
-    assert response.status_code == 200
-    assert response.json() == contacts[0]
-    mock_delete_contact.assert_called_once_with(contact_id, user_data)
-
-
-@pytest.mark.asyncio
-async def test_delete_contact_not_found(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
-
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
-    )
-
-    # Mock ContactService to return None for a missing contact
-    mock_delete_contact = AsyncMock(return_value=None)  # Contact not found
-    monkeypatch.setattr(
-        "src.services.contacts_service.ContactService.remove_contact",
-        mock_delete_contact,
-    )
-
-    # Contact ID to delete
-    contact_id = 999  # Non-existent contact ID
-
-    # API call to delete a non-existent contact
-    response = client.delete(f"/api/contacts/{contact_id}", headers=auth_headers)
-
-    # Assertions
-    assert response.status_code == 404
-    assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
-    mock_delete_contact.assert_called_once_with(contact_id, user_data)
-
-
-@pytest.mark.asyncio
-async def test_delete_contact_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
-        )
-    )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # Contact ID to delete
-    contact_id = contacts[0]["id"]
+    async def test_update_contact_invalid_data(self, aclient):
+        # Payload with invalid data
+        invalid_payload = {
+            "first_name": "",  # Missing or invalid required fields
+        }
 
-    # API call without authentication headers
-    response = client.delete(f"/api/contacts/{contact_id}")
+        # API call with invalid data
+        response = await aclient.put("/api/contacts/1", json=invalid_payload)
+
+        # Assertions
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    async def test_delete_contact_success(self, aclient):
+        # Mock ContactService to simulate contact deletion
+        with patch.object(
+            ContactService, "remove_contact", AsyncStub(contacts[0])
+        ) as mock_delete_contact:
+            # Contact ID to delete
+            contact_id = contacts[0]["id"]
+
+            # API call to delete the contact
+            response = await aclient.delete(f"/api/contacts/{contact_id}")
+
+        # Assertions
+        assert response.status_code == 200
+        assert response.json() == contacts[0]
+        mock_delete_contact.assert_called_once_with(contact_id, user_data)
+
+    async def test_delete_contact_not_found(self, aclient):
+        # Mock ContactService to return None for a missing contact
+        with patch.object(
+            ContactService, "remove_contact", AsyncStub(None)
+        ) as mock_delete_contact:
+            # Contact ID to delete
+            contact_id = 999  # Non-existent contact ID
+
+            # API call to delete a non-existent contact
+            response = await aclient.delete(f"/api/contacts/{contact_id}")
+
+        # Assertions
+        assert response.status_code == 404
+        assert response.json()["detail"] == messages.CONTACT_NOT_FOUND
+        mock_delete_contact.assert_called_once_with(contact_id, user_data)
+
+
+@pytest.fixture
+def unauth():
+    """
+    Install the 401-raising auth override for one unauthenticated test.
+
+    Function-scoped on purpose: the override is installed and restored around
+    each parametrization, so no reordering (--ff, -p no:randomly, xdist) can
+    leak 401s into the authenticated TestContactsAPI tests.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(app.dependency_overrides, get_current_user, raise_unauthorized)
+        yield
+
+
+@pytest.mark.parametrize(
+    "method,url,body",
+    [
+        ("get", "/api/contacts/birthdays?days=7", None),
+        ("get", "/api/contacts/", None),
+        ("get", "/api/contacts/1", None),
+        ("post", "/api/contacts/", payload),
+        ("put", "/api/contacts/1", {}),
+        ("delete", f"/api/contacts/{contacts[0]['id']}", None),
+        ("get", "/api/users/me", None),
+    ],
+)
+async def test_unauthenticated(aclient, unauth, method, url, body):
+    # Every protected endpoint behaves the same without valid credentials
+    kwargs = {"json": body} if body is not None else {}
+    response = await getattr(aclient, method)(url, **kwargs)
 
     # Assertions
     assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
     assert response.json()["detail"] == messages.UNAUTHORIZED
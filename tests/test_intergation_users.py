@@ -1,70 +1,65 @@
-from unittest import mock
-import pytest
-from unittest.mock import AsyncMock, MagicMock
-from fastapi import HTTPException, status
-from src.conf import messages
+from unittest.mock import patch
 
+from src.conf import messages
+from src.database.models import User, UserRole
+from src.services.upload_file_service import UploadFileService
+from tests.conftest import mock_user
 
-user_data_admin = {
-    "id": 1,
-    "username": "agent007",
-    "email": "agent007@gmail.com",
-    "password": "12345678",
-    "role": "admin",
-    "confirmed": True,
-    "avatar": "https://example.com/avatar.png",
+PRESIGN_RESPONSE = {
+    "url": "https://api.cloudinary.com/v1_1/demo/image/upload",
+    "params": {"public_id": "RestApp/boss", "signature": "signed"},
+    "avatar_url": "https://res.cloudinary.com/demo/RestApp/boss.png",
 }
 
-user_data_not_admin = {
-    "id": 1,
-    "username": "agent007",
-    "email": "agent007@gmail.com",
-    "password": "12345678",
-    "role": "user",
-    "confirmed": True,
-    "avatar": "https://example.com/avatar.png",
-}
 
+async def test_me(aclient):
+    # API call to get current user
+    response = await aclient.get("/api/users/me")
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.json()["email"] == mock_user["email"]
+    assert response.json()["username"] == mock_user["username"]
 
-@pytest.mark.asyncio
-async def test_me(client, monkeypatch, auth_headers):
-    # Mock jwt.decode to bypass token validation
-    mock_jwt_decode = MagicMock(return_value={"sub": user_data_admin["username"]})
-    monkeypatch.setattr("src.services.auth_service.jwt.decode", mock_jwt_decode)
 
-    # Mock get_user_from_db to return a test user
-    mock_get_user_from_db = AsyncMock(return_value=user_data_admin)
-    monkeypatch.setattr(
-        "src.services.auth_service.get_user_from_db", mock_get_user_from_db
+async def test_presign_avatar_requires_admin(aclient, mocked_auth):
+    # Authenticate as a regular user instead of the session default
+    mocked_auth(
+        User(
+            id=2,
+            username="regular",
+            email="regular@example.com",
+            avatar="https://example.com/regular.png",
+            role=UserRole.USER,
+        )
     )
 
-    # API call to get current user
-    response = client.get("/api/users/me", headers=auth_headers)
+    # API call
+    response = await aclient.get("/api/users/avatar/presign")
 
     # Assertions
-    assert response.status_code == 200
-    assert response.json()["email"] == user_data_admin["email"]
-    assert response.json()["username"] == user_data_admin["username"]
-    mock_jwt_decode.assert_called_once()
-    mock_get_user_from_db.assert_called_once_with(user_data_admin["username"], mock.ANY)
+    assert response.status_code == 403
+    assert response.json()["detail"] == messages.PERMISSION_DENIED
 
 
-@pytest.mark.asyncio
-async def test_me_unauthenticated(client, monkeypatch):
-    # Mock get_current_user to raise HTTPException for unauthorized access
-    mock_get_current_user = AsyncMock(
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=messages.UNAUTHORIZED,
+async def test_presign_avatar_admin(aclient, mocked_auth):
+    # Authenticate as an admin, the only role allowed to change avatars
+    admin = mocked_auth(
+        User(
+            id=3,
+            username="boss",
+            email="boss@example.com",
+            avatar="https://example.com/boss.png",
+            role=UserRole.ADMIN,
         )
     )
-    monkeypatch.setattr(
-        "src.services.auth_service.get_current_user", mock_get_current_user
-    )
-
-    # API call to get current user without valid authentication
-    response = client.get("/api/users/me")
+    with patch.object(
+        UploadFileService, "presign", return_value=PRESIGN_RESPONSE
+    ) as mock_presign:
+        # API call
+        response = await aclient.get("/api/users/avatar/presign")
 
     # Assertions
-    assert response.status_code == 401
-    assert response.json()["detail"] == messages.UNAUTHORIZED
+    assert response.status_code == 200
+    assert response.json() == PRESIGN_RESPONSE
+    mock_presign.assert_called_once_with(admin.username)
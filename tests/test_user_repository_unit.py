@@ -39,7 +39,6 @@ def user_body():
     )
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_id(user_repository, mock_session, user):
     # Setup mock
     mock_result = MagicMock()
@@ -55,7 +54,6 @@ async def test_get_user_by_id(user_repository, mock_session, user):
     mock_session.execute.return_value.scalar_one_or_none.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_username(user_repository, mock_session, user):
     # Setup mock
     mock_result = MagicMock()
@@ -71,7 +69,6 @@ async def test_get_user_by_username(user_repository, mock_session, user):
     mock_session.execute.return_value.scalar_one_or_none.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_email(user_repository, mock_session, user):
     # Setup mock
     mock_result = MagicMock()
@@ -87,7 +84,23 @@ async def test_get_user_by_email(user_repository, mock_session, user):
     mock_session.execute.return_value.scalar_one_or_none.assert_called_once()
 
 
-@pytest.mark.asyncio
+async def test_get_user_by_email_or_username(user_repository, mock_session, user):
+    # Setup mock
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.first.return_value = user
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    # Run test
+    result = await user_repository.get_user_by_email_or_username(
+        "test@example.com", "testuser"
+    )
+
+    # Assert
+    assert result == user
+    mock_session.execute.assert_called_once()
+    mock_session.execute.return_value.scalars.assert_called_once()
+
+
 async def test_create_user(user_repository, mock_session, user, user_body):
     # Setup mock
     mock_result = MagicMock()
@@ -107,10 +120,9 @@ async def test_create_user(user_repository, mock_session, user, user_body):
 
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_confirmed_email(user_repository, mock_session, user):
     # Setup mock
     mock_session.execute = AsyncMock(
@@ -126,7 +138,6 @@ async def test_confirmed_email(user_repository, mock_session, user):
     mock_session.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_update_avatar_url(user_repository, mock_session, user):
     # Setup mock
     mock_session.execute = AsyncMock(
@@ -140,10 +151,9 @@ async def test_update_avatar_url(user_repository, mock_session, user):
     # Assert
     assert result.avatar == new_avatar_url
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_reset_password(user_repository, mock_session, user):
     # Setup mock
     mock_session.execute = AsyncMock(
@@ -157,10 +167,9 @@ async def test_reset_password(user_repository, mock_session, user):
     # Assert
     assert result.hashed_password == new_password
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_reset_password_user_not_found(user_repository, mock_session):
     # Setup mock
     mock_session.execute = AsyncMock(